@@ -0,0 +1,67 @@
+"""
+Measure API cold start: how long `import main` takes in a fresh interpreter.
+
+Run from the backend directory:
+
+    python -m benchmarks.import_time --runs 10
+
+"lazy" is the current startup path. "eager" imports main and then runs the
+warm-up synchronously, which loads the same libraries and constructs the same
+services that main.py used to load at import time, so it stands in for the
+startup cost before lazy initialization.
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+from typing import Dict, List, Optional
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SCENARIOS = {
+    "lazy": "import main",
+    "eager": "import main; main.warm_up()",
+}
+
+TIMER = """
+import time
+_started = time.perf_counter()
+{code}
+print(time.perf_counter() - _started)
+"""
+
+
+def time_scenario(code: str, runs: int) -> List[float]:
+    """Run code in fresh interpreters and return wall times in seconds"""
+    env = dict(os.environ, WARMUP_ON_STARTUP="false")
+    samples = []
+    for _ in range(runs):
+        result = subprocess.run(
+            [sys.executable, "-c", TIMER.format(code=code)],
+            cwd=BACKEND_DIR, env=env, capture_output=True, text=True, check=True,
+        )
+        samples.append(float(result.stdout.strip().splitlines()[-1]))
+    return samples
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    arg_parser = argparse.ArgumentParser(description="Measure API import time")
+    arg_parser.add_argument("--runs", type=int, default=5)
+    args = arg_parser.parse_args(argv)
+
+    results: Dict[str, List[float]] = {}
+    for name, code in SCENARIOS.items():
+        results[name] = time_scenario(code, args.runs)
+
+    for name, samples in results.items():
+        print(f"{name:<6} median {statistics.median(samples) * 1000:8.1f}ms  "
+              f"min {min(samples) * 1000:8.1f}ms  max {max(samples) * 1000:8.1f}ms")
+
+    speedup = statistics.median(results["eager"]) / statistics.median(results["lazy"])
+    print(f"Lazy import is {speedup:.1f}x faster to start")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,71 @@
+"""
+Benchmark JobIndex.query over a large synthetic job corpus.
+
+Run from the backend directory:
+
+    python -m benchmarks.job_index_query --jobs 100000
+
+Also checks that every returned score matches AIProcessor._calculate_match.
+"""
+import argparse
+import random
+import sys
+import time
+from typing import List, Optional
+
+from benchmarks.run_benchmarks import percentile
+from benchmarks.synthetic_pdf import SKILL_POOL
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    arg_parser = argparse.ArgumentParser(description="Benchmark job index queries")
+    arg_parser.add_argument("--jobs", type=int, default=100000)
+    arg_parser.add_argument("--queries", type=int, default=50)
+    arg_parser.add_argument("--top", type=int, default=10)
+    arg_parser.add_argument("--seed", type=int, default=0)
+    args = arg_parser.parse_args(argv)
+
+    from services.ai_processor import AIProcessor
+    from services.job_index import JobIndex
+
+    rng = random.Random(args.seed)
+    # Extra synthetic skills make the vocabulary closer to real postings
+    pool = SKILL_POOL + [f"Skill {i}" for i in range(2000)]
+
+    started = time.perf_counter()
+    index = JobIndex()
+    requirements = {}
+    for i in range(args.jobs):
+        job_requirements = {
+            "required_skills": rng.sample(pool, rng.randint(0, 8)),
+            "preferred_skills": rng.sample(pool, rng.randint(0, 4)),
+        }
+        requirements[f"job-{i}"] = job_requirements
+        index.add(f"job-{i}", job_requirements)
+    index.query({"skills": []}, top_k=1)
+    print(f"Built index of {len(index)} jobs in {time.perf_counter() - started:.1f}s")
+
+    profiles = [{"skills": rng.sample(pool, 30)} for _ in range(args.queries)]
+    samples = []
+    for profile in profiles:
+        t0 = time.perf_counter()
+        index.query(profile, top_k=args.top)
+        samples.append(time.perf_counter() - t0)
+
+    print(f"query p50 {percentile(samples, 50) * 1000:.2f}ms  "
+          f"p95 {percentile(samples, 95) * 1000:.2f}ms  p99 {percentile(samples, 99) * 1000:.2f}ms")
+
+    # Cross-check the vectorized scores against the per-job implementation
+    ai_processor = AIProcessor.__new__(AIProcessor)
+    for profile in profiles[:5]:
+        for result in index.query(profile, top_k=args.top):
+            expected = ai_processor._calculate_match(profile, requirements[result["job_id"]])["score"]
+            if expected != result["match_score"]:
+                print(f"Score mismatch for {result['job_id']}: {result['match_score']} != {expected}")
+                return 1
+    print("Scores match AIProcessor._calculate_match")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,265 @@
+"""
+Benchmark the tailoring pipeline end to end.
+
+Run from the backend directory:
+
+    python -m benchmarks.run_benchmarks
+    python -m benchmarks.run_benchmarks --sizes small large --iterations 50
+    python -m benchmarks.run_benchmarks --save-baseline benchmarks/baseline.json
+    python -m benchmarks.run_benchmarks --baseline benchmarks/baseline.json
+
+Each stage is timed in isolation (PDF parsing, AI processing in mock mode and
+with a latency-injecting fake client, every document render) and the whole
+/tailor endpoint is driven through FastAPI's TestClient.
+"""
+import argparse
+import json
+import math
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Callable, Dict, List, Optional
+
+from benchmarks.synthetic_pdf import PROFILE_SIZES, JOB_DESCRIPTION, build_sized_profiles
+
+
+class _FakeContent:
+    def __init__(self, text: str):
+        self.text = text
+
+
+class _FakeResponse:
+    def __init__(self, text: str):
+        self.content = [_FakeContent(text)]
+
+
+class _FakeMessages:
+    def __init__(self, latency: float):
+        self.latency = latency
+
+    def create(self, system: str = "", messages: Optional[List[Dict]] = None, **kwargs) -> _FakeResponse:
+        """Sleep for the injected latency and answer like the real API would"""
+        time.sleep(self.latency)
+
+        if "requirement analyzer" in system:
+            return _FakeResponse(json.dumps({
+                "required_skills": ["Python", "SQL", "Docker", "AWS", "API"],
+                "preferred_skills": ["React", "TypeScript", "Git"],
+                "experience_years": "5+ years",
+                "key_responsibilities": ["Build API platform", "Work in agile team"],
+            }))
+        if "CV tailoring" in system:
+            return _FakeResponse(json.dumps({
+                "experience": [{"company": "Example Systems Inc.", "position": "Engineer",
+                                "duration": "2020 - Present", "description": "Built services."}],
+                "skills": ["Python", "SQL", "Docker"],
+            }))
+        return _FakeResponse("Dear Hiring Manager,\n\nI am a great fit.\n\nBest regards,\nJordan Example")
+
+
+class FakeLatencyClient:
+    """Stand-in for the Anthropic client that injects a fixed per-call latency"""
+
+    def __init__(self, latency: float):
+        self.messages = _FakeMessages(latency)
+
+
+def percentile(samples: List[float], pct: float) -> float:
+    """Nearest-rank percentile of a list of samples"""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+def measure(fn: Callable[[], object], iterations: int, warmup: int) -> Dict:
+    """Time fn over several iterations, then run it once more under tracemalloc"""
+    for _ in range(warmup):
+        fn()
+
+    samples = []
+    started = time.perf_counter()
+    for _ in range(iterations):
+        t0 = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - t0)
+    elapsed = time.perf_counter() - started
+
+    # Memory is measured separately so tracing overhead does not skew latency
+    tracemalloc.start()
+    try:
+        fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "iterations": iterations,
+        "p50_ms": percentile(samples, 50) * 1000,
+        "p95_ms": percentile(samples, 95) * 1000,
+        "p99_ms": percentile(samples, 99) * 1000,
+        "throughput_per_s": iterations / elapsed if elapsed > 0 else 0.0,
+        "peak_memory_kb": peak / 1024,
+    }
+
+
+def run_benchmarks(sizes: List[str], iterations: int, warmup: int, latency: float,
+                   include_api: bool = True) -> Dict[str, Dict]:
+    """Run every stage for every profile size and return results keyed by 'stage[size]'"""
+    # Mock mode unless a stage injects its own client
+    os.environ.pop("ANTHROPIC_API_KEY", None)
+
+    from services.pdf_parser import LinkedInPDFParser
+    from services.ai_processor import AIProcessor
+    from services.document_generator import DocumentGenerator
+
+    output_dir = tempfile.mkdtemp(prefix="bench_")
+    parser = LinkedInPDFParser()
+    mock_processor = AIProcessor()
+    fake_processor = AIProcessor()
+    fake_processor.client = FakeLatencyClient(latency)
+    generator = DocumentGenerator(output_dir)
+
+    profiles = build_sized_profiles(sizes)
+    results = {}
+
+    for size, pdf_bytes in profiles.items():
+        profile_data = parser.parse(pdf_bytes)
+        if not profile_data:
+            raise RuntimeError(f"Synthetic '{size}' profile could not be parsed")
+        ai_result = mock_processor.process(profile_data, JOB_DESCRIPTION)
+
+        stages = {
+            "parse": lambda: parser.parse(pdf_bytes),
+            "ai_process_mock": lambda: mock_processor.process(profile_data, JOB_DESCRIPTION),
+            "ai_process_fake_latency": lambda: fake_processor.process(profile_data, JOB_DESCRIPTION),
+            "render_cv_pdf": lambda: generator._generate_cv_pdf(ai_result),
+            "render_cv_docx": lambda: generator._generate_cv_docx(ai_result),
+            "render_cover_letter_pdf": lambda: generator._generate_cover_letter_pdf(ai_result),
+            "render_cover_letter_docx": lambda: generator._generate_cover_letter_docx(ai_result),
+        }
+
+        if include_api:
+            stages["api_tailor"] = _tailor_request(pdf_bytes, output_dir)
+
+        for stage, fn in stages.items():
+            # The fake client sleeps, so keep its run short
+            runs = max(1, iterations // 5) if stage == "ai_process_fake_latency" else iterations
+            key = f"{stage}[{size}]"
+            print(f"Benchmarking {key}...")
+            results[key] = measure(fn, runs, warmup)
+
+    return results
+
+
+def _tailor_request(pdf_bytes: bytes, output_dir: str) -> Callable[[], object]:
+    """Build a callable that posts the profile to /tailor through TestClient"""
+    from fastapi.testclient import TestClient
+    import main as api
+
+    # main loads .env on import, so force mock mode explicitly
+    api.get_ai_processor().client = None
+    api.get_doc_generator().output_dir = output_dir
+    client = TestClient(api.app)
+
+    def call():
+        response = client.post(
+            "/tailor",
+            files={"linkedin_pdf": ("profile.pdf", pdf_bytes, "application/pdf")},
+            data={"job_description": JOB_DESCRIPTION},
+        )
+        if response.status_code != 200:
+            raise RuntimeError(f"/tailor returned {response.status_code}: {response.text}")
+        return response
+
+    return call
+
+
+def compare_to_baseline(results: Dict[str, Dict], baseline: Dict[str, Dict],
+                        threshold: float) -> List[Dict]:
+    """Return stages whose p50 or p95 latency grew by more than threshold"""
+    regressions = []
+    for key, current in results.items():
+        previous = baseline.get(key)
+        if not previous:
+            continue
+        for metric in ("p50_ms", "p95_ms"):
+            before = previous.get(metric, 0)
+            after = current[metric]
+            if before > 0 and after > before * (1 + threshold):
+                regressions.append({
+                    "stage": key,
+                    "metric": metric,
+                    "baseline": before,
+                    "current": after,
+                    "change_pct": (after / before - 1) * 100,
+                })
+    return regressions
+
+
+def print_report(results: Dict[str, Dict], regressions: List[Dict]):
+    """Print a table of results and any regressions"""
+    header = f"{'stage':<40}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'ops/s':>10}{'peak KB':>12}"
+    print()
+    print(header)
+    print("-" * len(header))
+    for key, r in results.items():
+        print(f"{key:<40}{r['p50_ms']:>10.2f}{r['p95_ms']:>10.2f}{r['p99_ms']:>10.2f}"
+              f"{r['throughput_per_s']:>10.1f}{r['peak_memory_kb']:>12.1f}")
+
+    if regressions:
+        print()
+        print("REGRESSIONS:")
+        for reg in regressions:
+            print(f"  {reg['stage']} {reg['metric']}: {reg['baseline']:.2f} -> "
+                  f"{reg['current']:.2f} ms (+{reg['change_pct']:.1f}%)")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    arg_parser = argparse.ArgumentParser(description="Benchmark the CV tailoring pipeline")
+    arg_parser.add_argument("--sizes", nargs="+", default=list(PROFILE_SIZES), choices=list(PROFILE_SIZES))
+    arg_parser.add_argument("--iterations", type=int, default=20)
+    arg_parser.add_argument("--warmup", type=int, default=2)
+    arg_parser.add_argument("--latency", type=float, default=0.05,
+                            help="Seconds of latency injected per fake AI call")
+    arg_parser.add_argument("--no-api", action="store_true", help="Skip the /tailor TestClient run")
+    arg_parser.add_argument("--output", help="Write results JSON to this path")
+    arg_parser.add_argument("--baseline", help="Compare against a saved baseline JSON")
+    arg_parser.add_argument("--save-baseline", help="Save results as a new baseline JSON")
+    arg_parser.add_argument("--threshold", type=float, default=0.2,
+                            help="Allowed slowdown before flagging a regression (0.2 = 20%%)")
+    args = arg_parser.parse_args(argv)
+
+    results = run_benchmarks(args.sizes, args.iterations, args.warmup, args.latency,
+                             include_api=not args.no_api)
+
+    regressions = []
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        regressions = compare_to_baseline(results, baseline.get("results", {}), args.threshold)
+
+    print_report(results, regressions)
+
+    report = {
+        "python": sys.version.split()[0],
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "results": results,
+        "regressions": regressions,
+    }
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+    if args.save_baseline:
+        with open(args.save_baseline, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"Baseline saved to {args.save_baseline}")
+
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
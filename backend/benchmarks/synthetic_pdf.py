@@ -0,0 +1,72 @@
+from io import BytesIO
+from typing import Dict, List
+from reportlab.lib.pagesizes import letter
+from reportlab.lib.styles import getSampleStyleSheet
+from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
+
+
+# Named sizes used by the benchmark runner: (experiences, skills, education, certifications)
+PROFILE_SIZES = {
+    "small": (2, 8, 1, 1),
+    "medium": (8, 25, 2, 4),
+    "large": (30, 45, 4, 12),
+}
+
+SKILL_POOL = [
+    "Python", "JavaScript", "React", "SQL", "Docker", "AWS", "Java", "C++", "TypeScript",
+    "NodeJS", "Database", "API", "Agile", "Git", "Testing", "Communication", "Teamwork",
+    "Kubernetes", "Terraform", "GraphQL", "PostgreSQL", "Redis", "Kafka", "Spark",
+    "Machine Learning", "Data Analysis", "Leadership", "Scrum", "CI/CD", "Linux",
+]
+
+JOB_DESCRIPTION = """Senior Software Engineer
+
+We are looking for an engineer with strong Python, SQL and Docker experience
+to build our API platform on AWS. Familiarity with React, TypeScript, Git and
+automated testing is a plus. You will work in an agile team and need excellent
+communication and teamwork skills.
+"""
+
+
+def build_profile_pdf(experiences: int, skills: int, education: int = 1, certifications: int = 1) -> bytes:
+    """Render a LinkedIn-style profile PDF with the given number of entries"""
+    buffer = BytesIO()
+    doc = SimpleDocTemplate(buffer, pagesize=letter)
+    styles = getSampleStyleSheet()
+    story = []
+
+    def lines(block: List[str]):
+        for line in block:
+            story.append(Paragraph(line, styles['Normal']))
+        story.append(Spacer(1, 12))
+
+    lines(["Jordan Example", "Senior Software Engineer building reliable data platforms"])
+
+    story.append(Paragraph("Experience", styles['Heading2']))
+    for i in range(experiences):
+        lines([
+            f"Example Systems {i} Inc.",
+            f"Software Engineer {i}",
+            f"January {2000 + i % 20} - Present",
+            f"Built services in {SKILL_POOL[i % len(SKILL_POOL)]} and "
+            f"{SKILL_POOL[(i + 3) % len(SKILL_POOL)]} for internal customers.",
+        ])
+
+    story.append(Paragraph("Education", styles['Heading2']))
+    for i in range(education):
+        lines([f"University of Example {i}", "BSc Computer Science", "2010 - 2014"])
+
+    story.append(Paragraph("Skills", styles['Heading2']))
+    lines([f"{SKILL_POOL[i % len(SKILL_POOL)]}" for i in range(skills)])
+
+    story.append(Paragraph("Certifications", styles['Heading2']))
+    for i in range(certifications):
+        lines([f"Certified Practitioner {i}", "Example Academy", f"Issued {2015 + i % 10}"])
+
+    doc.build(story)
+    return buffer.getvalue()
+
+
+def build_sized_profiles(sizes: List[str]) -> Dict[str, bytes]:
+    """Render one synthetic PDF for each named size"""
+    return {name: build_profile_pdf(*PROFILE_SIZES[name]) for name in sizes}
@@ -0,0 +1,265 @@
+"""
+Bulk offline tailoring: one LinkedIn PDF against many job descriptions.
+
+Usage (from the backend directory):
+
+    python bulk_tailor.py profile.pdf jobs/ --output bulk_output
+    python bulk_tailor.py profile.pdf jobs.jsonl --output bulk_output --workers 8
+
+Job descriptions come from either a directory of .txt/.md files (the file name
+is the job id) or a JSONL file with "id" and "job_description" fields per line.
+
+Each job gets its own folder under --output with the CV and cover letter.
+Completed jobs are appended to checkpoint.jsonl as they finish, so re-running
+the same command after an interruption skips work that is already done. Each
+record carries a hash of the profile PDF and of the job description, and a job
+is re-run if either has changed since it was checkpointed.
+summary.csv lists the match score and missing skills for every job.
+"""
+import argparse
+import csv
+import hashlib
+import json
+import os
+import re
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, List, Optional
+
+from dotenv import load_dotenv
+
+# Load environment variables from .env file
+load_dotenv()
+
+from services.pdf_parser import LinkedInPDFParser
+from services.ai_processor import AIProcessor
+from services.document_generator import DocumentGenerator
+
+
+JOB_FILE_EXTENSIONS = (".txt", ".md")
+CHECKPOINT_FILE = "checkpoint.jsonl"
+SUMMARY_FILE = "summary.csv"
+
+
+def load_jobs(source: str) -> List[Dict]:
+    """Load job descriptions from a directory of text files or a JSONL file"""
+    jobs = []
+
+    if os.path.isdir(source):
+        for filename in sorted(os.listdir(source)):
+            if not filename.lower().endswith(JOB_FILE_EXTENSIONS):
+                continue
+            with open(os.path.join(source, filename), encoding="utf-8") as f:
+                jobs.append({"id": os.path.splitext(filename)[0], "job_description": f.read()})
+    else:
+        with open(source, encoding="utf-8") as f:
+            for line_number, line in enumerate(f, start=1):
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                description = record.get("job_description") or record.get("description")
+                if not description:
+                    raise ValueError(f"{source}:{line_number}: missing job_description")
+                jobs.append({"id": str(record.get("id", line_number)), "job_description": description})
+
+    seen = set()
+    for job in jobs:
+        job["id"] = _safe_id(job["id"])
+        if job["id"] in seen:
+            raise ValueError(f"Duplicate job id: {job['id']}")
+        seen.add(job["id"])
+
+    return jobs
+
+
+def fingerprint(content: bytes) -> str:
+    """Short content hash used to tell whether a checkpointed result is still valid"""
+    return hashlib.sha256(content).hexdigest()[:16]
+
+
+def truncate_partial_line(path: str):
+    """Drop a partially written last line left by an interrupted run so new records start on their own line"""
+    with open(path, "rb+") as f:
+        content = f.read()
+        if content and not content.endswith(b"\n"):
+            f.truncate(content.rfind(b"\n") + 1)
+
+
+def append_checkpoint(path: str, record: Dict):
+    """Append one JSON record and make sure it reaches the disk"""
+    with open(path, "a", encoding="utf-8") as f:
+        f.write(json.dumps(record) + "\n")
+        f.flush()
+        os.fsync(f.fileno())
+
+
+def _safe_id(job_id: str) -> str:
+    """Make a job id usable as a folder name"""
+    return re.sub(r'[^A-Za-z0-9._-]+', '_', job_id).strip('._') or "job"
+
+
+class BulkTailor:
+    """
+    Run the tailoring pipeline for one profile against many job descriptions:
+    - Parses the LinkedIn PDF once
+    - Processes jobs on a bounded thread pool
+    - Checkpoints each finished job so interrupted runs can resume
+    """
+
+    def __init__(self, output_dir: str, workers: int = 4):
+        self.output_dir = output_dir
+        self.workers = workers
+        self.ai_processor = AIProcessor()
+        self.checkpoint_path = os.path.join(output_dir, CHECKPOINT_FILE)
+        self._checkpoint_lock = threading.Lock()
+        self._local = threading.local()
+        os.makedirs(output_dir, exist_ok=True)
+
+    def load_checkpoint(self) -> Dict[str, Dict]:
+        """Return records of jobs that already completed successfully"""
+        completed = {}
+        if not os.path.exists(self.checkpoint_path):
+            return completed
+
+        truncate_partial_line(self.checkpoint_path)
+
+        with open(self.checkpoint_path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                if record.get("status") == "ok":
+                    completed[record["id"]] = record
+        return completed
+
+    def run(self, pdf_content: bytes, jobs: List[Dict]) -> List[Dict]:
+        """Tailor the profile to every job not already in the checkpoint"""
+        profile_data = LinkedInPDFParser().parse(pdf_content)
+        if not profile_data:
+            raise ValueError("Failed to parse LinkedIn PDF")
+        print(f"Profile parsed: {profile_data.get('name', 'Unknown')}")
+
+        # Results are only reused when both the profile PDF and the job text are unchanged
+        profile_hash = fingerprint(pdf_content)
+        checkpointed = self.load_checkpoint()
+        records = {}
+        stale = []
+        pending = []
+        for job in jobs:
+            job["job_hash"] = fingerprint(job["job_description"].encode("utf-8"))
+            record = checkpointed.get(job["id"])
+            if record and record.get("profile_hash") == profile_hash and record.get("job_hash") == job["job_hash"]:
+                records[job["id"]] = record
+                continue
+            if record:
+                stale.append(job["id"])
+            pending.append(job)
+
+        if stale:
+            print(f"Warning: {len(stale)} checkpointed jobs have a different profile PDF or job description "
+                  f"and will be re-run: {', '.join(stale)}")
+        print(f"{len(jobs)} jobs, {len(records)} already done, {len(pending)} to process")
+
+        started = time.perf_counter()
+
+        executor = ThreadPoolExecutor(max_workers=self.workers)
+        try:
+            futures = [executor.submit(self._process_job, profile_data, profile_hash, job) for job in pending]
+            for done, future in enumerate(as_completed(futures), start=1):
+                record = future.result()
+                records[record["id"]] = record
+                self._append_checkpoint(record)
+                status = f"{record['match_score']}%" if record["status"] == "ok" else f"ERROR: {record['error']}"
+                print(f"[{done}/{len(pending)}] {record['id']}: {status}")
+        except KeyboardInterrupt:
+            # Drop queued jobs; finished ones are already checkpointed
+            executor.shutdown(wait=False, cancel_futures=True)
+            print("Interrupted - re-run the same command to resume")
+            raise
+        executor.shutdown()
+
+        print(f"Processed {len(pending)} jobs in {time.perf_counter() - started:.1f}s")
+
+        # Keep the input order in the summary
+        return [records[job["id"]] for job in jobs if job["id"] in records]
+
+    def write_summary(self, records: List[Dict]) -> str:
+        """Write summary.csv with one row per job"""
+        summary_path = os.path.join(self.output_dir, SUMMARY_FILE)
+        with open(summary_path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(["job_id", "status", "match_score", "missing_skills", "cv_path", "cover_letter_path", "error"])
+            for record in records:
+                writer.writerow([
+                    record["id"],
+                    record["status"],
+                    record.get("match_score", ""),
+                    "; ".join(record.get("missing_skills", [])),
+                    record.get("cv_path", ""),
+                    record.get("cover_letter_path", ""),
+                    record.get("error", ""),
+                ])
+        return summary_path
+
+    def _process_job(self, profile_data: Dict, profile_hash: str, job: Dict) -> Dict:
+        """Run AI processing and document generation for one job"""
+        record = {"id": job["id"], "profile_hash": profile_hash, "job_hash": job["job_hash"]}
+        try:
+            ai_result = self.ai_processor.process(profile_data, job["job_description"])
+
+            generator = self._generator()
+            generator.output_dir = os.path.join(self.output_dir, job["id"])
+            os.makedirs(generator.output_dir, exist_ok=True)
+            cv_path = generator.generate_cv(ai_result)
+            cover_letter_path = generator.generate_cover_letter(ai_result)
+
+            record.update({
+                "status": "ok",
+                "match_score": ai_result["match_score"],
+                "missing_skills": ai_result["missing_skills"],
+                "cv_path": cv_path,
+                "cover_letter_path": cover_letter_path,
+            })
+        except Exception as e:
+            record.update({"status": "error", "error": str(e)})
+        return record
+
+    def _generator(self) -> DocumentGenerator:
+        """One generator per worker thread so styles are built once per thread"""
+        generator = getattr(self._local, "generator", None)
+        if generator is None:
+            generator = DocumentGenerator(self.output_dir)
+            self._local.generator = generator
+        return generator
+
+    def _append_checkpoint(self, record: Dict):
+        with self._checkpoint_lock:
+            append_checkpoint(self.checkpoint_path, record)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    arg_parser = argparse.ArgumentParser(description="Tailor one LinkedIn profile to many job descriptions")
+    arg_parser.add_argument("linkedin_pdf", help="LinkedIn profile PDF")
+    arg_parser.add_argument("jobs", help="Directory of .txt/.md job descriptions or a JSONL file")
+    arg_parser.add_argument("--output", default="bulk_output", help="Output directory (also holds the checkpoint)")
+    arg_parser.add_argument("--workers", type=int, default=4, help="Number of jobs processed in parallel")
+    args = arg_parser.parse_args(argv)
+
+    with open(args.linkedin_pdf, "rb") as f:
+        pdf_content = f.read()
+    jobs = load_jobs(args.jobs)
+
+    bulk = BulkTailor(args.output, workers=max(1, args.workers))
+    records = bulk.run(pdf_content, jobs)
+    summary_path = bulk.write_summary(records)
+
+    failed = [r for r in records if r["status"] != "ok"]
+    print(f"Summary written to {summary_path} ({len(records) - len(failed)} ok, {len(failed)} failed)")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,158 @@
+"""
+Rank stored job postings for a LinkedIn profile without spending LLM calls.
+
+Usage (from the backend directory):
+
+    python job_match.py build jobs/ --index job_index.npz --workers 8
+    python job_match.py query profile.pdf --index job_index.npz --top 20
+
+Jobs are read the same way as bulk_tailor.py (a directory of .txt/.md files or
+a JSONL file). Building extracts requirements once per job; querying scores the
+profile against the whole index with the same 70/30 match score as /tailor.
+
+Extractions run on a bounded thread pool and are checkpointed next to the index
+(<index>.extract.jsonl), so an interrupted build resumes without repeating LLM
+calls. Jobs whose extraction returned no skills are not checkpointed and are
+retried on the next build.
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Dict, List, Optional
+
+from dotenv import load_dotenv
+
+# Load environment variables from .env file
+load_dotenv()
+
+from bulk_tailor import load_jobs, fingerprint, truncate_partial_line, append_checkpoint
+from services.pdf_parser import LinkedInPDFParser
+from services.ai_processor import AIProcessor
+from services.job_index import JobIndex, has_requirements
+
+
+def load_extractions(checkpoint_path: str) -> Dict[str, Dict]:
+    """Return checkpointed extractions keyed by job id"""
+    extractions = {}
+    if not os.path.exists(checkpoint_path):
+        return extractions
+
+    truncate_partial_line(checkpoint_path)
+    with open(checkpoint_path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            extractions[record["id"]] = record
+    return extractions
+
+
+def build(jobs_source: str, index_path: str, workers: int = 4) -> int:
+    jobs = load_jobs(jobs_source)
+    ai_processor = AIProcessor()
+    checkpoint_path = index_path + ".extract.jsonl"
+
+    # Reuse extractions only while the job text is unchanged
+    extractions = {}
+    checkpointed = load_extractions(checkpoint_path)
+    pending = []
+    for job in jobs:
+        job["job_hash"] = fingerprint(job["job_description"].encode("utf-8"))
+        record = checkpointed.get(job["id"])
+        if record and record.get("job_hash") == job["job_hash"]:
+            extractions[job["id"]] = record["job_requirements"]
+        else:
+            pending.append(job)
+    print(f"{len(jobs)} jobs, {len(extractions)} already extracted, {len(pending)} to extract")
+
+    def extract(job: Dict) -> Dict:
+        return ai_processor._extract_job_requirements(job["job_description"])
+
+    started = time.perf_counter()
+    executor = ThreadPoolExecutor(max_workers=workers)
+    try:
+        futures = {executor.submit(extract, job): job for job in pending}
+        for done, future in enumerate(as_completed(futures), start=1):
+            job = futures[future]
+            job_requirements = future.result()
+            extractions[job["id"]] = job_requirements
+            # Failed extractions are left out so the next build retries them
+            if has_requirements(job_requirements):
+                append_checkpoint(checkpoint_path, {
+                    "id": job["id"],
+                    "job_hash": job["job_hash"],
+                    "job_requirements": job_requirements,
+                })
+            if done % 100 == 0 or done == len(pending):
+                print(f"[{done}/{len(pending)}] extracted")
+    except KeyboardInterrupt:
+        # Drop queued jobs; finished ones are already checkpointed
+        executor.shutdown(wait=False, cancel_futures=True)
+        print("Interrupted - re-run the same command to resume")
+        raise
+    executor.shutdown()
+
+    # Add in input order so ties rank the same way on every build
+    index = JobIndex()
+    skipped = []
+    for job in jobs:
+        job_requirements = extractions[job["id"]]
+        if has_requirements(job_requirements):
+            index.add(job["id"], job_requirements)
+        else:
+            skipped.append(job["id"])
+    index.save(index_path)
+
+    print(f"Indexed {len(index)} jobs ({len(index.vocabulary)} distinct skills) "
+          f"in {time.perf_counter() - started:.1f}s -> {index_path}")
+    if skipped:
+        print(f"Skipped {len(skipped)} jobs with no extracted requirements: {', '.join(skipped)}")
+    return 0
+
+
+def query(pdf_path: str, index_path: str, top_k: int) -> int:
+    with open(pdf_path, "rb") as f:
+        profile_data = LinkedInPDFParser().parse(f.read())
+    if not profile_data:
+        print("Failed to parse LinkedIn PDF")
+        return 1
+
+    index = JobIndex.load(index_path)
+
+    started = time.perf_counter()
+    results = index.query(profile_data, top_k=top_k)
+    elapsed_ms = (time.perf_counter() - started) * 1000
+
+    print(f"Top {len(results)} of {len(index)} jobs for {profile_data.get('name', 'Unknown')} ({elapsed_ms:.1f}ms)")
+    for rank, result in enumerate(results, start=1):
+        missing = ", ".join(result["missing_skills"]) or "-"
+        print(f"{rank:>3}. {result['job_id']:<40} {result['match_score']:>3}%  missing: {missing}")
+    return 0
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    arg_parser = argparse.ArgumentParser(description="Rank job postings for a LinkedIn profile")
+    commands = arg_parser.add_subparsers(dest="command", required=True)
+
+    build_parser = commands.add_parser("build", help="Build an index from job descriptions")
+    build_parser.add_argument("jobs", help="Directory of .txt/.md job descriptions or a JSONL file")
+    build_parser.add_argument("--index", default="job_index.npz", help="Index file to write")
+    build_parser.add_argument("--workers", type=int, default=4, help="Number of extractions run in parallel")
+
+    query_parser = commands.add_parser("query", help="Rank indexed jobs for a profile")
+    query_parser.add_argument("linkedin_pdf", help="LinkedIn profile PDF")
+    query_parser.add_argument("--index", default="job_index.npz", help="Index file to read")
+    query_parser.add_argument("--top", type=int, default=10, help="Number of jobs to return")
+
+    args = arg_parser.parse_args(argv)
+    if args.command == "build":
+        return build(args.jobs, args.index, workers=max(1, args.workers))
+    return query(args.linkedin_pdf, args.index, args.top)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
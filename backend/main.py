@@ -1,10 +1,15 @@
-from fastapi import FastAPI, UploadFile, File, Form, HTTPException
+from fastapi import FastAPI, UploadFile, File, Form, HTTPException, Header, Request
 from fastapi.responses import FileResponse
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
 from typing import List, Optional
 import os
 import json
+import secrets
+import threading
+import time
+from contextlib import asynccontextmanager
+from functools import lru_cache
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
@@ -13,8 +18,18 @@ load_dotenv()
 from services.pdf_parser import LinkedInPDFParser
 from services.ai_processor import AIProcessor
 from services.document_generator import DocumentGenerator
+from services.request_profiler import RequestProfiler
 
-app = FastAPI(title="Li-Taylored CV API")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Warm up in the background so startup is not blocked (disable with WARMUP_ON_STARTUP=false)"""
+    if os.getenv("WARMUP_ON_STARTUP", "true").lower() in ("1", "true", "yes"):
+        threading.Thread(target=warm_up, name="warm-up", daemon=True).start()
+    yield
+
+
+app = FastAPI(title="Li-Taylored CV API", lifespan=lifespan)
 
 # CORS middleware
 app.add_middleware(
@@ -25,15 +40,59 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Initialize services
-pdf_parser = LinkedInPDFParser()
-ai_processor = AIProcessor()
-doc_generator = DocumentGenerator()
+profiler = RequestProfiler()
+
+
+# Services are created on first use so importing the app does not pull in
+# pdfplumber, reportlab, python-docx or the anthropic SDK
+@lru_cache(maxsize=None)
+def get_pdf_parser() -> LinkedInPDFParser:
+    return LinkedInPDFParser()
+
+
+@lru_cache(maxsize=None)
+def get_ai_processor() -> AIProcessor:
+    return AIProcessor()
+
+
+@lru_cache(maxsize=None)
+def get_doc_generator() -> DocumentGenerator:
+    return DocumentGenerator()
+
+
+def warm_up():
+    """Create the services, pre-load the heavy libraries and build the ReportLab styles"""
+    started = time.perf_counter()
+    get_pdf_parser().warm_up()
+    get_ai_processor()
+    get_doc_generator().warm_up()
+    print(f"Warm-up completed in {(time.perf_counter() - started) * 1000:.0f}ms")
 
 # Create temp directory for storing generated files
 os.makedirs("temp", exist_ok=True)
 
 
+async def profile_requests(request: Request, call_next):
+    """Capture stage profiles for sampled or slow requests (opt-in via PROFILING_ENABLED)"""
+    capture = profiler.begin(request.method, request.url.path)
+    if capture is None:
+        return await call_next(request)
+
+    started = time.perf_counter()
+    status_code = 500
+    try:
+        response = await call_next(request)
+        status_code = response.status_code
+        return response
+    finally:
+        profiler.end(capture, (time.perf_counter() - started) * 1000, status_code)
+
+
+# Only install the middleware when profiling is on, so other requests pay nothing
+if profiler.enabled:
+    app.middleware("http")(profile_requests)
+
+
 class AuthRequest(BaseModel):
     email: str
     password: str
@@ -78,7 +137,8 @@ async def tailor_application(
         # 1. Parse LinkedIn PDF
         print(f"Parsing PDF: {linkedin_pdf.filename}")
         pdf_content = await linkedin_pdf.read()
-        profile_data = pdf_parser.parse(pdf_content)
+        with profiler.stage("parse"):
+            profile_data = get_pdf_parser().parse(pdf_content)
         
         if not profile_data:
             raise HTTPException(status_code=400, detail="Failed to parse LinkedIn PDF")
@@ -87,14 +147,17 @@ async def tailor_application(
         
         # 2. Process with AI
         print("Processing with AI...")
-        ai_result = ai_processor.process(profile_data, job_description)
+        with profiler.stage("ai"):
+            ai_result = get_ai_processor().process(profile_data, job_description)
         
         print(f"Match score: {ai_result['match_score']}%")
         
         # 3. Generate documents
         print("Generating documents...")
-        cv_path = doc_generator.generate_cv(ai_result)
-        cover_letter_path = doc_generator.generate_cover_letter(ai_result)
+        with profiler.stage("render_cv"):
+            cv_path = get_doc_generator().generate_cv(ai_result)
+        with profiler.stage("render_cover_letter"):
+            cover_letter_path = get_doc_generator().generate_cover_letter(ai_result)
         
         print("Documents generated successfully")
         
@@ -130,6 +193,42 @@ async def download_document(doc_type: str):
     )
 
 
+def _check_admin_token(token: Optional[str]):
+    """Admin endpoints require PROFILING_ADMIN_TOKEN to be set and matched"""
+    if not profiler.admin_token or not secrets.compare_digest((token or "").encode(), profiler.admin_token.encode()):
+        raise HTTPException(status_code=403, detail="Invalid admin token")
+
+
+@app.get("/admin/profiles")
+async def list_profiles(x_admin_token: Optional[str] = Header(None)):
+    """List captured request profiles, newest first"""
+    _check_admin_token(x_admin_token)
+    return {
+        "enabled": profiler.enabled,
+        "sample_rate": profiler.sample_rate,
+        "slow_threshold_ms": profiler.slow_threshold_ms,
+        "profiles": profiler.list_captures(),
+    }
+
+
+@app.get("/admin/profiles/{profile_id}")
+async def get_profile(profile_id: str, x_admin_token: Optional[str] = Header(None)):
+    """Return one capture with per-stage cProfile output and allocation diffs"""
+    _check_admin_token(x_admin_token)
+    capture = profiler.get_capture(profile_id)
+    if not capture:
+        raise HTTPException(status_code=404, detail="Profile not found")
+    return capture
+
+
+@app.delete("/admin/profiles")
+async def clear_profiles(x_admin_token: Optional[str] = Header(None)):
+    """Drop all stored captures"""
+    _check_admin_token(x_admin_token)
+    profiler.clear()
+    return {"message": "Profiles cleared"}
+
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=8000)
@@ -1,7 +1,6 @@
 import os
 import re
 from typing import Dict, List
-from anthropic import Anthropic
 import json
 
 
@@ -26,6 +25,8 @@ class AIProcessor:
             print("Warning: ANTHROPIC_API_KEY not set. Using mock mode.")
             self.client = None
         else:
+            # Imported here so the SDK is only loaded when it is actually used
+            from anthropic import Anthropic
             self.client = Anthropic(api_key=api_key)
     
     def process(self, profile_data: Dict, job_description: str) -> Dict:
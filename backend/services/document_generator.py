@@ -1,14 +1,10 @@
+import importlib
 import os
-from reportlab.lib.pagesizes import letter
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
-from reportlab.lib.units import inch
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle
-from reportlab.lib import colors
-from reportlab.lib.enums import TA_LEFT, TA_CENTER, TA_RIGHT
+from datetime import datetime
 from typing import Dict
-from docx import Document
-from docx.shared import Pt, RGBColor, Inches
-from docx.enum.text import WD_ALIGN_PARAGRAPH
+
+# reportlab and python-docx are imported inside the methods that use them
+# so that importing this module (and the API) stays fast
 
 
 class DocumentGenerator:
@@ -20,25 +16,28 @@ class DocumentGenerator:
     ATS-friendly formatting
     """
     
-    def __init__(self):
-        self.output_dir = "temp"
+    def __init__(self, output_dir: str = "temp"):
+        self.output_dir = output_dir
         os.makedirs(self.output_dir, exist_ok=True)
+        self._styles = None
     
-    def generate_cv(self, ai_result: Dict) -> str:
-        """Generate tailored CV in PDF format"""
-        
-        pdf_path = os.path.join(self.output_dir, "cv.pdf")
+    def warm_up(self):
+        """Pre-import reportlab/python-docx and build the shared paragraph styles"""
+        for module in ("docx", "docx.enum.text", "docx.shared", "reportlab.platypus"):
+            importlib.import_module(module)
+        self._get_styles()
+    
+    def _get_styles(self) -> Dict:
+        """Build the sample stylesheet and custom styles once and reuse them"""
+        if self._styles is not None:
+            return self._styles
         
-        # Create PDF document
-        doc = SimpleDocTemplate(pdf_path, pagesize=letter,
-                              leftMargin=0.75*inch, rightMargin=0.75*inch,
-                              topMargin=0.75*inch, bottomMargin=0.75*inch)
+        from reportlab.lib import colors
+        from reportlab.lib.enums import TA_CENTER
+        from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
         
-        # Container for PDF elements
-        story = []
         styles = getSampleStyleSheet()
         
-        # Custom styles
         title_style = ParagraphStyle(
             'CustomTitle',
             parent=styles['Heading1'],
@@ -61,6 +60,50 @@ class DocumentGenerator:
             borderRadius=None,
         )
         
+        header_style = ParagraphStyle(
+            'Header',
+            parent=styles['Normal'],
+            fontSize=12,
+            textColor=colors.HexColor('#0a66c2'),
+            spaceAfter=20
+        )
+        
+        self._styles = {
+            'Normal': styles['Normal'],
+            'CustomTitle': title_style,
+            'CustomHeading': heading_style,
+            'Header': header_style,
+        }
+        return self._styles
+    
+    def generate_cv(self, ai_result: Dict) -> str:
+        """Generate tailored CV in PDF format"""
+        pdf_path = self._generate_cv_pdf(ai_result)
+        
+        # Also generate DOCX version
+        self._generate_cv_docx(ai_result)
+        
+        return pdf_path
+    
+    def _generate_cv_pdf(self, ai_result: Dict) -> str:
+        """Build the CV PDF only"""
+        from reportlab.lib.pagesizes import letter
+        from reportlab.lib.units import inch
+        from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
+        
+        pdf_path = os.path.join(self.output_dir, "cv.pdf")
+        
+        # Create PDF document
+        doc = SimpleDocTemplate(pdf_path, pagesize=letter,
+                              leftMargin=0.75*inch, rightMargin=0.75*inch,
+                              topMargin=0.75*inch, bottomMargin=0.75*inch)
+        
+        # Container for PDF elements
+        story = []
+        styles = self._get_styles()
+        title_style = styles['CustomTitle']
+        heading_style = styles['CustomHeading']
+        
         # Name and headline
         profile_data = ai_result["profile_data"]
         story.append(Paragraph(profile_data.get("name", ""), title_style))
@@ -116,13 +159,13 @@ class DocumentGenerator:
         # Build PDF
         doc.build(story)
         
-        # Also generate DOCX version
-        self._generate_cv_docx(ai_result)
-        
         return pdf_path
     
     def _generate_cv_docx(self, ai_result: Dict) -> str:
         """Generate CV in DOCX format for easier editing"""
+        from docx import Document
+        from docx.enum.text import WD_ALIGN_PARAGRAPH
+        from docx.shared import RGBColor
         
         docx_path = os.path.join(self.output_dir, "cv.docx")
         doc = Document()
@@ -179,6 +222,18 @@ class DocumentGenerator:
     
     def generate_cover_letter(self, ai_result: Dict) -> str:
         """Generate cover letter in PDF format"""
+        pdf_path = self._generate_cover_letter_pdf(ai_result)
+        
+        # Also generate DOCX version
+        self._generate_cover_letter_docx(ai_result)
+        
+        return pdf_path
+    
+    def _generate_cover_letter_pdf(self, ai_result: Dict) -> str:
+        """Build the cover letter PDF only"""
+        from reportlab.lib.pagesizes import letter
+        from reportlab.lib.units import inch
+        from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer
         
         pdf_path = os.path.join(self.output_dir, "cover_letter.pdf")
         
@@ -188,16 +243,8 @@ class DocumentGenerator:
                               topMargin=1*inch, bottomMargin=1*inch)
         
         story = []
-        styles = getSampleStyleSheet()
-        
-        # Custom styles
-        header_style = ParagraphStyle(
-            'Header',
-            parent=styles['Normal'],
-            fontSize=12,
-            textColor=colors.HexColor('#0a66c2'),
-            spaceAfter=20
-        )
+        styles = self._get_styles()
+        header_style = styles['Header']
         
         # Sender info
         profile_data = ai_result["profile_data"]
@@ -205,7 +252,6 @@ class DocumentGenerator:
         story.append(Spacer(1, 0.5*inch))
         
         # Date
-        from datetime import datetime
         story.append(Paragraph(datetime.now().strftime("%B %d, %Y"), styles['Normal']))
         story.append(Spacer(1, 0.3*inch))
         
@@ -223,13 +269,12 @@ class DocumentGenerator:
         # Build PDF
         doc.build(story)
         
-        # Also generate DOCX version
-        self._generate_cover_letter_docx(ai_result)
-        
         return pdf_path
     
     def _generate_cover_letter_docx(self, ai_result: Dict) -> str:
         """Generate cover letter in DOCX format"""
+        from docx import Document
+        from docx.shared import Pt, RGBColor
         
         docx_path = os.path.join(self.output_dir, "cover_letter.docx")
         doc = Document()
@@ -244,7 +289,6 @@ class DocumentGenerator:
         doc.add_paragraph()
         
         # Date
-        from datetime import datetime
         doc.add_paragraph(datetime.now().strftime("%B %d, %Y"))
         doc.add_paragraph()
         
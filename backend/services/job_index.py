@@ -0,0 +1,195 @@
+import json
+from typing import Dict, List, Optional
+
+import numpy as np
+
+
+def has_requirements(job_requirements: Dict) -> bool:
+    """
+    Whether an extraction produced any skills.
+
+    _extract_job_requirements returns empty lists on API/JSON errors, and such
+    a job would otherwise score as a perfect match for every profile.
+    """
+    return bool(job_requirements.get("required_skills") or job_requirements.get("preferred_skills"))
+
+
+class JobIndex:
+    """
+    Local index of job postings for ranking one profile against many jobs:
+    - Stores each job's normalized required/preferred skills as sparse rows
+      (one shared skill vocabulary, CSR-style index arrays)
+    - Scores a profile against every job in one vectorized pass
+    - Uses the same 70/30 required/preferred scoring as AIProcessor._calculate_match
+
+    Requirements come from AIProcessor._extract_job_requirements, so building
+    the index costs one extraction per job, while querying costs no LLM calls.
+    """
+
+    def __init__(self):
+        self.job_ids: List[str] = []
+        self.vocabulary: Dict[str, int] = {}
+        self._required: List[List[int]] = []
+        self._preferred: List[List[int]] = []
+        self._arrays: Optional[Dict[str, np.ndarray]] = None
+
+    def __len__(self) -> int:
+        return len(self.job_ids)
+
+    def add(self, job_id: str, job_requirements: Dict):
+        """Add a job from an extracted requirements dict"""
+        self._unpack()
+        self.job_ids.append(job_id)
+        self._required.append(self._skill_ids(job_requirements.get("required_skills", [])))
+        self._preferred.append(self._skill_ids(job_requirements.get("preferred_skills", [])))
+        self._arrays = None
+
+    def add_description(self, job_id: str, job_description: str, ai_processor) -> bool:
+        """
+        Extract requirements from a job description and add the job.
+
+        Returns False without adding the job when extraction produced no skills
+        (see has_requirements).
+        """
+        job_requirements = ai_processor._extract_job_requirements(job_description)
+        if not has_requirements(job_requirements):
+            return False
+        self.add(job_id, job_requirements)
+        return True
+
+    def query(self, profile_data: Dict, top_k: int = 10) -> List[Dict]:
+        """Return the top_k jobs for a parsed profile, best match first"""
+        if not self.job_ids or top_k <= 0:
+            return []
+
+        arrays = self._build()
+        profile_skills = set([s.lower() for s in profile_data.get("skills", [])])
+
+        has_skill = np.zeros(len(self.vocabulary), dtype=np.float64)
+        profile_ids = [self.vocabulary[s] for s in profile_skills if s in self.vocabulary]
+        has_skill[profile_ids] = 1.0
+
+        scores = self._scores(arrays, has_skill)
+        top = self._top_indices(scores, top_k)
+
+        skill_names = self._skill_names()
+        indptr = arrays["required_indptr"]
+        indices = arrays["required_indices"]
+        results = []
+        for i in top:
+            required = indices[indptr[i]:indptr[i + 1]].tolist()
+            missing = sorted(skill_names[s] for s in required if not has_skill[s])
+            results.append({
+                "job_id": self.job_ids[i],
+                "match_score": int(scores[i]),
+                "missing_skills": missing[:5],
+            })
+        return results
+
+    def save(self, path: str):
+        """Write the index to a compressed .npz file"""
+        arrays = self._build()
+        np.savez_compressed(
+            path,
+            job_ids=np.array(json.dumps(self.job_ids)),
+            vocabulary=np.array(json.dumps(self._skill_names())),
+            required_indptr=arrays["required_indptr"],
+            required_indices=arrays["required_indices"],
+            preferred_indptr=arrays["preferred_indptr"],
+            preferred_indices=arrays["preferred_indices"],
+        )
+
+    @classmethod
+    def load(cls, path: str) -> "JobIndex":
+        """Load an index written by save(), keeping the packed arrays as they are"""
+        index = cls()
+        with np.load(path) as data:
+            index.job_ids = json.loads(str(data["job_ids"]))
+            index.vocabulary = {skill: i for i, skill in enumerate(json.loads(str(data["vocabulary"])))}
+            arrays = {}
+            for name in ("required", "preferred"):
+                arrays.update(cls._pack(name, data[f"{name}_indptr"], data[f"{name}_indices"]))
+        index._arrays = arrays
+        return index
+
+    def _skill_ids(self, skills: List[str]) -> List[int]:
+        """Normalize skills the way _calculate_match does and map them to vocabulary ids"""
+        ids = []
+        for skill in set([s.lower() for s in skills]):
+            if skill not in self.vocabulary:
+                self.vocabulary[skill] = len(self.vocabulary)
+            ids.append(self.vocabulary[skill])
+        return sorted(ids)
+
+    def _skill_names(self) -> List[str]:
+        names = [""] * len(self.vocabulary)
+        for skill, i in self.vocabulary.items():
+            names[i] = skill
+        return names
+
+    def _build(self) -> Dict[str, np.ndarray]:
+        """Pack the per-job skill lists into flat arrays (cached until the next add)"""
+        if self._arrays is not None:
+            return self._arrays
+
+        arrays = {}
+        for name, rows in (("required", self._required), ("preferred", self._preferred)):
+            indptr = np.zeros(len(rows) + 1, dtype=np.int64)
+            np.cumsum([len(row) for row in rows], out=indptr[1:])
+            indices = np.array([s for row in rows for s in row], dtype=np.int32)
+            arrays.update(self._pack(name, indptr, indices))
+
+        self._arrays = arrays
+        return arrays
+
+    def _unpack(self):
+        """Rebuild the per-job skill lists of a loaded index before it is extended"""
+        if self._arrays is None or len(self._required) == len(self.job_ids):
+            return
+        for name in ("required", "preferred"):
+            indptr = self._arrays[f"{name}_indptr"]
+            indices = self._arrays[f"{name}_indices"]
+            rows = [indices[indptr[i]:indptr[i + 1]].tolist() for i in range(len(indptr) - 1)]
+            setattr(self, f"_{name}", rows)
+
+    @staticmethod
+    def _pack(name: str, indptr: np.ndarray, indices: np.ndarray) -> Dict[str, np.ndarray]:
+        """Derive the per-entry job rows and per-job counts used by _scores from indptr"""
+        counts = np.diff(indptr)
+        return {
+            f"{name}_indptr": indptr,
+            f"{name}_indices": indices,
+            f"{name}_rows": np.repeat(np.arange(len(counts), dtype=np.int32), counts),
+            f"{name}_counts": counts.astype(np.float64),
+        }
+
+    def _scores(self, arrays: Dict[str, np.ndarray], has_skill: np.ndarray) -> np.ndarray:
+        """Vectorized version of AIProcessor._calculate_match scoring for every job"""
+        n_jobs = len(self.job_ids)
+
+        def part(name: str, weight: float) -> np.ndarray:
+            matched = np.bincount(arrays[f"{name}_rows"], weights=has_skill[arrays[f"{name}_indices"]],
+                                  minlength=n_jobs)
+            counts = arrays[f"{name}_counts"]
+            # Jobs without skills of this kind get the full weight, as in _calculate_match
+            ratio = np.divide(matched, counts, out=np.ones(n_jobs), where=counts > 0)
+            return ratio * weight
+
+        total = np.floor(part("required", 70) + part("preferred", 30)).astype(np.int64)
+
+        # Ensure reasonable score (at least 40%) and cap at 95%
+        total = np.where(total < 40, 40 + total // 2, total)
+        return np.minimum(total, 95)
+
+    @staticmethod
+    def _top_indices(scores: np.ndarray, top_k: int) -> np.ndarray:
+        """Indices of the top_k scores, ties broken by insertion order"""
+        n = len(scores)
+        if top_k >= n:
+            return np.argsort(-scores, kind="stable")
+
+        threshold = np.partition(scores, n - top_k)[n - top_k]
+        above = np.flatnonzero(scores > threshold)
+        tied = np.flatnonzero(scores == threshold)[:top_k - len(above)]
+        candidates = np.concatenate([above, tied])
+        return candidates[np.lexsort((candidates, -scores[candidates]))]
@@ -1,8 +1,17 @@
-import pdfplumber
+import importlib
 import re
 from typing import Dict, List, Optional
 from io import BytesIO
 
+# Section patterns are compiled once at import; pdfplumber (and pdfminer) are
+# imported on first parse so that loading the API stays fast
+EXPERIENCE_PATTERN = re.compile(r'Experience\s+(.*?)(?=Education|Skills|Certifications|$)', re.DOTALL | re.IGNORECASE)
+EXPERIENCE_SPLIT_PATTERN = re.compile(r'\n(?=[A-Z][a-z]+.*(?:Inc\.|LLC|Ltd|Corporation|Company))')
+EDUCATION_PATTERN = re.compile(r'Education\s+(.*?)(?=Experience|Skills|Certifications|Licenses|$)', re.DOTALL | re.IGNORECASE)
+SKILLS_PATTERN = re.compile(r'Skills\s+(.*?)(?=Education|Experience|Certifications|Languages|$)', re.DOTALL | re.IGNORECASE)
+SKILLS_SPLIT_PATTERN = re.compile(r'[\n•·]')
+CERTIFICATIONS_PATTERN = re.compile(r'(?:Certifications?|Licenses?)\s+(.*?)(?=Education|Experience|Skills|$)', re.DOTALL | re.IGNORECASE)
+
 
 class LinkedInPDFParser:
     """
@@ -14,8 +23,14 @@ class LinkedInPDFParser:
     - Certifications
     """
     
+    def warm_up(self):
+        """Pre-import pdfplumber and pdfminer so the first parse is not slowed down"""
+        importlib.import_module("pdfplumber")
+    
     def parse(self, pdf_content: bytes) -> Dict:
         """Parse LinkedIn PDF and return structured data"""
+        import pdfplumber
+        
         try:
             with pdfplumber.open(BytesIO(pdf_content)) as pdf:
                 text = ""
@@ -60,15 +75,14 @@ class LinkedInPDFParser:
         experiences = []
         
         # Look for "Experience" section
-        experience_pattern = r'Experience\s+(.*?)(?=Education|Skills|Certifications|$)'
-        match = re.search(experience_pattern, text, re.DOTALL | re.IGNORECASE)
+        match = EXPERIENCE_PATTERN.search(text)
         
         if match:
             experience_text = match.group(1)
             
             # Split by company/position patterns
             # LinkedIn format typically: Company Name\nPosition\nDates\nDescription
-            entries = re.split(r'\n(?=[A-Z][a-z]+.*(?:Inc\.|LLC|Ltd|Corporation|Company))', experience_text)
+            entries = EXPERIENCE_SPLIT_PATTERN.split(experience_text)
             
             for entry in entries:
                 if len(entry.strip()) > 20:  # Filter out noise
@@ -86,8 +100,7 @@ class LinkedInPDFParser:
         """Extract education section"""
         education = []
         
-        education_pattern = r'Education\s+(.*?)(?=Experience|Skills|Certifications|Licenses|$)'
-        match = re.search(education_pattern, text, re.DOTALL | re.IGNORECASE)
+        match = EDUCATION_PATTERN.search(text)
         
         if match:
             edu_text = match.group(1)
@@ -108,13 +121,12 @@ class LinkedInPDFParser:
         """Extract skills section"""
         skills = []
         
-        skills_pattern = r'Skills\s+(.*?)(?=Education|Experience|Certifications|Languages|$)'
-        match = re.search(skills_pattern, text, re.DOTALL | re.IGNORECASE)
+        match = SKILLS_PATTERN.search(text)
         
         if match:
             skills_text = match.group(1)
             # Split by newlines and bullet points
-            skill_lines = re.split(r'[\n•·]', skills_text)
+            skill_lines = SKILLS_SPLIT_PATTERN.split(skills_text)
             skills = [s.strip() for s in skill_lines if s.strip() and len(s.strip()) < 50]
         
         return skills
@@ -123,8 +135,7 @@ class LinkedInPDFParser:
         """Extract certifications and licenses"""
         certifications = []
         
-        cert_pattern = r'(?:Certifications?|Licenses?)\s+(.*?)(?=Education|Experience|Skills|$)'
-        match = re.search(cert_pattern, text, re.DOTALL | re.IGNORECASE)
+        match = CERTIFICATIONS_PATTERN.search(text)
         
         if match:
             cert_text = match.group(1)
@@ -0,0 +1,180 @@
+import cProfile
+import io
+import os
+import pstats
+import random
+import threading
+import time
+import tracemalloc
+import uuid
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, List, Optional
+
+
+_current_capture: ContextVar[Optional[Dict]] = ContextVar("current_capture", default=None)
+
+# Keep the profiler's own allocations out of the per-stage diffs
+_ALLOCATION_FILTERS = [
+    tracemalloc.Filter(False, module.__file__)
+    for module in (tracemalloc, cProfile, pstats)
+] + [tracemalloc.Filter(False, __file__)]
+
+
+class RequestProfiler:
+    """
+    Opt-in profiling for slow requests:
+    - Samples a fraction of requests, or keeps any request above a latency threshold
+    - Captures a cProfile per pipeline stage (parse, ai, render, ...)
+    - Optionally records tracemalloc allocation diffs per stage
+    - Keeps the most recent captures in memory for the admin endpoint
+
+    Disabled unless PROFILING_ENABLED is set, so production pays nothing by default.
+    Setting PROFILING_SLOW_MS runs cProfile on every matching request (only slow
+    ones are kept), which can make stages several times slower; use a generous
+    threshold. tracemalloc is only enabled for sampled requests. A capture's
+    duration_ms includes this profiling overhead.
+    """
+
+    def __init__(self):
+        self.enabled = os.getenv("PROFILING_ENABLED", "false").lower() in ("1", "true", "yes")
+        self.sample_rate = float(os.getenv("PROFILING_SAMPLE_RATE", "0"))
+        self.slow_threshold_ms = float(os.getenv("PROFILING_SLOW_MS", "0"))
+        self.trace_memory = os.getenv("PROFILING_TRACEMALLOC", "false").lower() in ("1", "true", "yes")
+        self.admin_token = os.getenv("PROFILING_ADMIN_TOKEN", "")
+        self.paths = [p.strip() for p in os.getenv("PROFILING_PATHS", "/tailor").split(",") if p.strip()]
+        self.top_n = int(os.getenv("PROFILING_TOP_N", "30"))
+
+        self._captures = deque(maxlen=int(os.getenv("PROFILING_MAX_CAPTURES", "50")))
+        self._lock = threading.Lock()
+        self._tracemalloc_users = 0
+
+    def begin(self, method: str, path: str) -> Optional[Dict]:
+        """Start a capture for the current request, or return None if it is not profiled"""
+        if not self.enabled or path not in self.paths:
+            return None
+
+        sampled = random.random() < self.sample_rate
+        # A latency threshold means every request is profiled and only slow ones are kept
+        if not sampled and self.slow_threshold_ms <= 0:
+            return None
+
+        # Memory tracing is too costly to pay on every threshold-only request
+        trace_memory = self.trace_memory and sampled
+
+        capture = {
+            "id": uuid.uuid4().hex[:12],
+            "method": method,
+            "path": path,
+            "started_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "sampled": sampled,
+            "trace_memory": trace_memory,
+            "stages": [],
+        }
+        if trace_memory:
+            self._start_tracemalloc()
+        capture["_context_token"] = _current_capture.set(capture)
+        return capture
+
+    def end(self, capture: Dict, elapsed_ms: float, status_code: int):
+        """Finish a capture and keep it if it was sampled or slow"""
+        _current_capture.reset(capture.pop("_context_token"))
+        if capture["trace_memory"]:
+            self._stop_tracemalloc()
+
+        capture["duration_ms"] = round(elapsed_ms, 2)
+        capture["status_code"] = status_code
+
+        slow = self.slow_threshold_ms > 0 and elapsed_ms >= self.slow_threshold_ms
+        if not (slow or capture["sampled"]):
+            return
+
+        capture["trigger"] = "slow" if slow else "sampled"
+        # Formatting is deferred to here so discarded requests never pay for pstats
+        for stage in capture["stages"]:
+            stage["profile"] = self._format_profile(stage["profile"])
+        with self._lock:
+            self._captures.append(capture)
+        print(f"Profile captured: {capture['id']} {capture['path']} {capture['duration_ms']}ms ({capture['trigger']})")
+
+    @contextmanager
+    def stage(self, name: str):
+        """Profile a pipeline stage if the current request is being captured"""
+        capture = _current_capture.get()
+        if capture is None:
+            yield
+            return
+
+        trace_memory = capture["trace_memory"] and tracemalloc.is_tracing()
+        before = tracemalloc.take_snapshot() if trace_memory else None
+        profile = cProfile.Profile()
+        started = time.perf_counter()
+        profile.enable()
+        try:
+            yield
+        finally:
+            profile.disable()
+            duration_ms = round((time.perf_counter() - started) * 1000, 2)
+            after = tracemalloc.take_snapshot() if before is not None else None
+
+            # The raw profile is formatted in end() only if the capture is kept
+            stage = {
+                "name": name,
+                "duration_ms": duration_ms,
+                "profile": profile,
+            }
+            if after is not None:
+                diff = after.filter_traces(_ALLOCATION_FILTERS).compare_to(
+                    before.filter_traces(_ALLOCATION_FILTERS), "lineno")
+                stage["allocations"] = [str(stat) for stat in diff[:self.top_n]]
+            capture["stages"].append(stage)
+
+    def list_captures(self) -> List[Dict]:
+        """Summaries of stored captures, newest first"""
+        with self._lock:
+            captures = list(self._captures)
+        return [
+            {
+                "id": c["id"],
+                "path": c["path"],
+                "started_at": c["started_at"],
+                "duration_ms": c["duration_ms"],
+                "status_code": c["status_code"],
+                "trigger": c["trigger"],
+                "stages": {s["name"]: s["duration_ms"] for s in c["stages"]},
+            }
+            for c in reversed(captures)
+        ]
+
+    def get_capture(self, capture_id: str) -> Optional[Dict]:
+        """Full capture including per-stage profiles and allocations"""
+        with self._lock:
+            for capture in self._captures:
+                if capture["id"] == capture_id:
+                    return capture
+        return None
+
+    def clear(self):
+        with self._lock:
+            self._captures.clear()
+
+    def _format_profile(self, profile: cProfile.Profile) -> str:
+        """Render the hottest functions by cumulative time as text"""
+        output = io.StringIO()
+        stats = pstats.Stats(profile, stream=output)
+        stats.sort_stats("cumulative").print_stats(self.top_n)
+        return output.getvalue()
+
+    def _start_tracemalloc(self):
+        # tracemalloc is process-wide, so concurrent captures share one session
+        with self._lock:
+            if self._tracemalloc_users == 0 and not tracemalloc.is_tracing():
+                tracemalloc.start()
+            self._tracemalloc_users += 1
+
+    def _stop_tracemalloc(self):
+        with self._lock:
+            self._tracemalloc_users -= 1
+            if self._tracemalloc_users == 0 and tracemalloc.is_tracing():
+                tracemalloc.stop()